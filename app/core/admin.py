@@ -32,6 +32,20 @@ class UserAdmin(BaseUserAdmin):
     )
 
 
-admin.register(models.Tag)
-admin.register(models.Ingredient)
-admin.register(models.Recipe)
+@admin.register(models.Tag)
+class TagAdmin(admin.ModelAdmin):
+    ordering = ('name',)
+    list_display = ('name', 'user')
+    list_select_related = ('user',)
+    search_fields = ('name',)
+
+
+@admin.register(models.Ingredient)
+class IngredientAdmin(admin.ModelAdmin):
+    ordering = ('name',)
+    list_display = ('name', 'user')
+    list_select_related = ('user',)
+    search_fields = ('name',)
+
+
+admin.site.register(models.Recipe)
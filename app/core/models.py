@@ -63,6 +63,11 @@ class Tag(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -75,6 +80,11 @@ class Ingredient(models.Model):
         on_delete=models.CASCADE
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -1,23 +1,32 @@
 from django.urls import reverse
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.contrib.auth import get_user_model
 
+from core.models import Tag, Ingredient
+from core.tests.utils import fast_password_hasher
 
+
+User = get_user_model()
+
+
+@fast_password_hasher
 class AdminSiteTest(TestCase):
 
-	def setUp(self):
-		self.client = Client()
-		self.admin_user = get_user_model().objects.create_superuser(
+	@classmethod
+	def setUpTestData(cls):
+		cls.admin_user = User.objects.create_superuser(
 			email='admin@test.com',
 			password='StrongPassword123'
 		)
-		self.client.force_login(self.admin_user)
-		self.user = get_user_model().objects.create_user(
+		cls.user = User.objects.create_user(
 			email='test@test.com',
 			password='StrongPassword123',
 			name='Test User Full Name'
 		)
 
+	def setUp(self):
+		self.client.force_login(self.admin_user)
+
 	def test_user_listed(self):
 		"""Test that users are listed on user page."""
 		url = reverse('admin:core_user_changelist')
@@ -39,3 +48,32 @@ class AdminSiteTest(TestCase):
 		res = self.client.get(url)
 
 		self.assertEqual(res.status_code, 200)
+
+	def test_tag_changelist(self):
+		"""Test that the tag list page loads users in the same query."""
+		for user in (self.admin_user, self.user):
+			Tag.objects.create(user=user, name='Goiana')
+		url = reverse('admin:core_tag_changelist')
+
+		with self.assertNumQueries(5):
+			res = self.client.get(url)
+
+		self.assertContains(res, self.user.email)
+
+	def test_ingredient_changelist(self):
+		"""Test that the ingredient list page loads users in the same query."""
+		for user in (self.admin_user, self.user):
+			Ingredient.objects.create(user=user, name='Pequi')
+		url = reverse('admin:core_ingredient_changelist')
+
+		with self.assertNumQueries(5):
+			res = self.client.get(url)
+
+		self.assertContains(res, self.user.email)
+
+	def test_recipe_changelist(self):
+		"""Test that the recipe list page works."""
+		url = reverse('admin:core_recipe_changelist')
+		res = self.client.get(url)
+
+		self.assertEqual(res.status_code, 200)
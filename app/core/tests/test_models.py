@@ -6,9 +6,12 @@ from django.contrib.auth import get_user_model
 from core import models
 
 
+User = get_user_model()
+
+
 def sample_user(email='test@test.com', password='password123'):
 	"""Create a sample user."""
-	return get_user_model().objects.create_user(email, password)
+	return User.objects.create_user(email, password)
 
 
 class ModelTests(TestCase):
@@ -17,7 +20,7 @@ class ModelTests(TestCase):
 		"""Test creating a new user with an email is successful."""
 		email = 'test@test.com'
 		password = 'StrongPassword123'
-		user = get_user_model().objects.create_user(
+		user = User.objects.create_user(
 			email=email,
 			password=password
 		)
@@ -29,7 +32,7 @@ class ModelTests(TestCase):
 		"""Test the email for a new user is normalized."""
 		email = 'test@TEST.COM'
 		password = 'StrongPassword123'
-		user = get_user_model().objects.create_user(
+		user = User.objects.create_user(
 			email=email,
 			password=password
 		)
@@ -39,7 +42,7 @@ class ModelTests(TestCase):
 	def test_new_user_invalid_email(self):
 		"""Test creating user with no email raises error."""
 		with self.assertRaises(ValueError):
-			get_user_model().objects.create_user(
+			User.objects.create_user(
 				email=None,
 				password='test123'
 			)
@@ -48,7 +51,7 @@ class ModelTests(TestCase):
 		"""Test creating a new superuser."""
 		email = 'test@test.com'
 		password = 'StrongPassword123'
-		user = get_user_model().objects.create_superuser(
+		user = User.objects.create_superuser(
 			email=email,
 			password=password
 		)
@@ -0,0 +1,7 @@
+from django.test import override_settings
+
+
+# Run a test case with a cheap password hasher.
+fast_password_hasher = override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
@@ -0,0 +1,38 @@
+from django import forms
+
+from django_filters import rest_framework as filters
+
+from core.models import Tag, Ingredient
+
+
+class IntegerFilter(filters.Filter):
+    """Filter taking an integer value."""
+    field_class = forms.IntegerField
+
+
+class RecipeAttrFilter(filters.FilterSet):
+    """Base filter set for user owned recipe attributes."""
+    assigned_only = IntegerFilter(method='filter_assigned_only')
+
+    def filter_assigned_only(self, queryset, name, value):
+        """Keep only objects assigned to at least one recipe."""
+        if value:
+            return queryset.filter(recipe__isnull=False).distinct()
+
+        return queryset
+
+
+class TagFilter(RecipeAttrFilter):
+    """Filter tags."""
+
+    class Meta:
+        model = Tag
+        fields = ()
+
+
+class IngredientFilter(RecipeAttrFilter):
+    """Filter ingredients."""
+
+    class Meta:
+        model = Ingredient
+        fields = ()
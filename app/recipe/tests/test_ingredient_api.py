@@ -1,64 +1,78 @@
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Ingredient, Recipe
+from core.tests.utils import fast_password_hasher
 
-from recipe.serializers import IngredientSerializer
 
+User = get_user_model()
 
-INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
-
-class PublicIngredientsAPITests(TestCase):
+class PublicIngredientsAPITests(SimpleTestCase):
     """Test the public available ingredients API."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
     def test_login_required(self):
         """Test that login is required to access the endpoint."""
-        res = self.client.get(INGREDIENTS_URL)
+        res = self.client.get(self.INGREDIENTS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@fast_password_hasher
 class PrivateIngredientAPITests(TestCase):
     """Test the private ingredients API."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.INGREDIENTS_URL = reverse('recipe:ingredient-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             'test@test.com',
             'testpassword'
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         """Test retrieving a list of ingredients."""
-        for ingredient in ['Pequi', 'Pimenta']:
-            Ingredient.objects.create(user=self.user, name=ingredient)
+        Ingredient.objects.bulk_create([
+            Ingredient(user=self.user, name=name)
+            for name in ('Pequi', 'Pimenta')
+        ])
 
-        res = self.client.get(INGREDIENTS_URL)
+        res = self.client.get(self.INGREDIENTS_URL)
 
-        ingredients = Ingredient.objects.all().order_by('-name')
-        serializer = IngredientSerializer(ingredients, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(
+            [ingredient['name'] for ingredient in res.data],
+            ['Pimenta', 'Pequi']
+        )
 
     def test_ingredients_limited_to_user(self):
         """Test that ingredients for the authenticated user are returned."""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             'fulano@test.com',
             'senhafulano'
         )
         Ingredient.objects.create(user=user2, name='Pequi')
         ingredient = Ingredient.objects.create(user=self.user, name='Bodinho')
 
-        res = self.client.get(INGREDIENTS_URL)
+        res = self.client.get(self.INGREDIENTS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
@@ -67,19 +81,20 @@ class PrivateIngredientAPITests(TestCase):
     def test_create_ingredient_successful(self):
         """Test create a new ingredient."""
         payload = {'name': 'Pequi'}
-        self.client.post(INGREDIENTS_URL, payload)
+        res = self.client.post(self.INGREDIENTS_URL, payload)
 
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['name'], payload['name'])
         exists = Ingredient.objects.filter(
-            user=self.user,
-            name=payload['name']
+            id=res.data['id'],
+            user=self.user
         ).exists()
-
         self.assertTrue(exists)
 
     def test_create_ingredient_invalid(self):
         """Test creating invalid ingredient fails."""
         payload = {'name': ''}
-        res = self.client.post(INGREDIENTS_URL, payload)
+        res = self.client.post(self.INGREDIENTS_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -89,10 +104,7 @@ class PrivateIngredientAPITests(TestCase):
             user=self.user,
             name='Farinha'
         )
-        ingredient2 = Ingredient.objects.create(
-            user=self.user,
-            name='Sal'
-        )
+        Ingredient.objects.create(user=self.user, name='Sal')
         recipe = Recipe.objects.create(
             title='Bolo de Fubá',
             time_minutes=90,
@@ -101,12 +113,12 @@ class PrivateIngredientAPITests(TestCase):
         )
         recipe.ingredients.add(ingredient1)
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        res = self.client.get(self.INGREDIENTS_URL, {'assigned_only': 1})
 
-        serializer1 = IngredientSerializer(ingredient1)
-        serializer2 = IngredientSerializer(ingredient2)
-        self.assertIn(serializer1.data, res.data)
-        self.assertNotIn(serializer2.data, res.data)
+        self.assertEqual(
+            {ingredient['id'] for ingredient in res.data},
+            {ingredient1.id}
+        )
 
     def test_retrieve_ingredients_assigned_unique(self):
         """
@@ -132,6 +144,26 @@ class PrivateIngredientAPITests(TestCase):
         recipe1.ingredients.add(ingredient)
         recipe2.ingredients.add(ingredient)
 
-        res = self.client.get(INGREDIENTS_URL, {'assigned_only': 1})
+        res = self.client.get(self.INGREDIENTS_URL, {'assigned_only': 1})
 
         self.assertEqual(len(res.data), 1)
+
+    def test_retrieve_ingredients_assigned_only_zero(self):
+        """Test that assigned_only=0 returns unassigned ingredients too."""
+        Ingredient.objects.create(user=self.user, name='Sal')
+
+        res = self.client.get(self.INGREDIENTS_URL, {'assigned_only': 0})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
+
+    def test_retrieve_ingredients_assigned_only_invalid(self):
+        """Test that a non integer assigned_only is rejected."""
+        for value in ('true', 'abc'):
+            with self.subTest(value=value):
+                res = self.client.get(
+                    self.INGREDIENTS_URL,
+                    {'assigned_only': value}
+                )
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
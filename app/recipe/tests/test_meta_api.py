@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.test import SimpleTestCase, TestCase
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.models import Tag, Ingredient, Recipe
+from core.tests.utils import fast_password_hasher
+
+
+User = get_user_model()
+
+
+class PublicMetaAPITests(SimpleTestCase):
+    """Test the public available recipe meta API."""
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.META_URL = reverse('recipe:meta')
+
+    def test_login_required(self):
+        """Test that login is required for retrieving recipe meta."""
+        res = self.client.get(self.META_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@fast_password_hasher
+class PrivateMetaAPITests(TestCase):
+    """Test the authorized user recipe meta API."""
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.META_URL = reverse('recipe:meta')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            'minerva@hogwarts.com',
+            'transfiguration'
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(self.user)
+
+    def test_retrieve_meta(self):
+        """Test retrieving tags and ingredients of the user together."""
+        user2 = User.objects.create_user(
+            'draco@hogwarts.com',
+            'slytherin'
+        )
+        Tag.objects.create(user=user2, name='Vegan')
+        Tag.objects.create(user=self.user, name='Mineira')
+        Ingredient.objects.create(user=self.user, name='Pequi')
+
+        res = self.client.get(self.META_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [tag['name'] for tag in res.data['tags']],
+            ['Mineira']
+        )
+        self.assertEqual(
+            [ingredient['name'] for ingredient in res.data['ingredients']],
+            ['Pequi']
+        )
+
+    def test_retrieve_meta_assigned_only(self):
+        """Test filtering tags and ingredients assigned to recipes."""
+        tag = Tag.objects.create(user=self.user, name='Doce')
+        Tag.objects.create(user=self.user, name='Salgada')
+        ingredient = Ingredient.objects.create(user=self.user, name='Leite')
+        Ingredient.objects.create(user=self.user, name='Sal')
+        for title in ('Doce de Leite', 'Arroz Doce'):
+            recipe = Recipe.objects.create(
+                title=title,
+                time_minutes=60,
+                price=10.00,
+                user=self.user
+            )
+            recipe.tags.add(tag)
+            recipe.ingredients.add(ingredient)
+
+        res = self.client.get(self.META_URL, {'assigned_only': 1})
+
+        self.assertEqual([t['id'] for t in res.data['tags']], [tag.id])
+        self.assertEqual(
+            [i['id'] for i in res.data['ingredients']],
+            [ingredient.id]
+        )
+
+    def test_retrieve_meta_assigned_only_invalid(self):
+        """Test that a non integer assigned_only is rejected."""
+        for value in ('true', 'abc'):
+            with self.subTest(value=value):
+                res = self.client.get(self.META_URL, {'assigned_only': value})
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
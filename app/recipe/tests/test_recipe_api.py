@@ -7,18 +7,19 @@ import tempfile
 from PIL import Image
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.urls import reverse
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Recipe, Tag, Ingredient
+from core.tests.utils import fast_password_hasher
 
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
 
-RECIPES_URL = reverse('recipe:recipe-list')
+User = get_user_model()
 
 
 def image_upload_url(recipe_id):
@@ -53,28 +54,40 @@ def sample_recipe(user, **params):
     return Recipe.objects.create(user=user, **defaults)
 
 
-class PublicRecipeApiTests(TestCase):
+class PublicRecipeApiTests(SimpleTestCase):
     """Test unauthenticated recipe API access"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.RECIPES_URL = reverse('recipe:recipe-list')
 
     def test_required_auth(self):
         """Test the authenticaiton is required"""
-        res = self.client.get(RECIPES_URL)
+        res = self.client.get(self.RECIPES_URL)
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@fast_password_hasher
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.RECIPES_URL = reverse('recipe:recipe-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             'jose@howarts.com',
             'testpass'
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
@@ -82,23 +95,36 @@ class PrivateRecipeApiTests(TestCase):
         sample_recipe(user=self.user)
         sample_recipe(user=self.user)
 
-        res = self.client.get(RECIPES_URL)
+        res = self.client.get(self.RECIPES_URL)
 
         recipes = Recipe.objects.all().order_by('-id')
         serializer = RecipeSerializer(recipes, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
+    def test_retrieve_recipes_query_count(self):
+        """Test that listing recipes prefetches tags and ingredients."""
+        for name in ('Goiana', 'Mineira', 'Baiana'):
+            recipe = sample_recipe(user=self.user, title=f'Comida {name}')
+            recipe.tags.add(sample_tag(user=self.user, name=name))
+            recipe.ingredients.add(sample_ingredient(user=self.user))
+
+        with self.assertNumQueries(3):
+            res = self.client.get(self.RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 3)
+
     def test_recipes_limited_to_user(self):
         """Test retrieving recipes for user"""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             'jose_carlos@howarts.com',
             'password123'
         )
         sample_recipe(user=user2)
         sample_recipe(user=self.user)
 
-        res = self.client.get(RECIPES_URL)
+        res = self.client.get(self.RECIPES_URL)
 
         recipes = Recipe.objects.filter(user=self.user)
         serializer = RecipeSerializer(recipes, many=True)
@@ -125,7 +151,7 @@ class PrivateRecipeApiTests(TestCase):
             'time_minutes': 30,
             'price': 5.00
         }
-        res = self.client.post(RECIPES_URL, payload)
+        res = self.client.post(self.RECIPES_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
         recipe = Recipe.objects.get(id=res.data['id'])
@@ -142,7 +168,7 @@ class PrivateRecipeApiTests(TestCase):
             'time_minutes': 60,
             'price': 20.00
         }
-        res = self.client.post(RECIPES_URL, payload)
+        res = self.client.post(self.RECIPES_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
         recipe = Recipe.objects.get(id=res.data['id'])
@@ -162,7 +188,7 @@ class PrivateRecipeApiTests(TestCase):
             'price': 7.00
         }
 
-        res = self.client.post(RECIPES_URL, payload)
+        res = self.client.post(self.RECIPES_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
         recipe = Recipe.objects.get(id=res.data['id'])
@@ -209,15 +235,24 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(len(tags), 0)
 
 
+@fast_password_hasher
 class RecipeImageUploadTests(TestCase):
     """Test upload image."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.RECIPES_URL = reverse('recipe:recipe-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             'jose_carlos@hogwarts.com',
             'ravenclaw'
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
         self.recipe = sample_recipe(user=self.user)
 
@@ -256,7 +291,7 @@ class RecipeImageUploadTests(TestCase):
         recipe2.tags.add(tag2)
 
         res = self.client.get(
-            RECIPES_URL,
+            self.RECIPES_URL,
             {'tags': f'{tag1.id},{tag2.id}'}
         )
 
@@ -278,7 +313,7 @@ class RecipeImageUploadTests(TestCase):
         recipe2.ingredients.add(ingredient2)
 
         res = self.client.get(
-            RECIPES_URL,
+            self.RECIPES_URL,
             {'ingredients': f'{ingredient1.id},{ingredient2.id}'}
         )
 
@@ -1,64 +1,74 @@
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from core.models import Tag, Recipe
+from core.tests.utils import fast_password_hasher
 
-from recipe.serializers import TagSerializer
 
+User = get_user_model()
 
-TAGS_URL = reverse('recipe:tag-list')
 
-
-class PublicTagsAPITests(TestCase):
+class PublicTagsAPITests(SimpleTestCase):
     """Test the public available tags API."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.TAGS_URL = reverse('recipe:tag-list')
 
     def test_login_required(self):
         """Test that login is required for retrieving tags."""
-        res = self.client.get(TAGS_URL)
+        res = self.client.get(self.TAGS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@fast_password_hasher
 class PrivateTagsAPITests(TestCase):
     """Test the authorized user tags API."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.TAGS_URL = reverse('recipe:tag-list')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             'snape@hogwarts.com',
             'imserious'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """Test retrieving tags."""
-        for tag in ['Vegan', 'Meal']:
-            Tag.objects.create(user=self.user, name=tag)
+        Tag.objects.bulk_create(
+            [Tag(user=self.user, name=name) for name in ('Vegan', 'Meal')]
+        )
 
-        res = self.client.get(TAGS_URL)
+        res = self.client.get(self.TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual([tag['name'] for tag in res.data], ['Vegan', 'Meal'])
 
     def test_tag_limited_to_user(self):
         """Test that tags returned are for the authenticated user."""
-        user2 = get_user_model().objects.create_user(
+        user2 = User.objects.create_user(
             'rony@hogsmeade.com',
             'weasleyF'
         )
         Tag.objects.create(user=user2, name='Vegan')
         tag = Tag.objects.create(user=self.user, name='Meal')
 
-        res = self.client.get(TAGS_URL)
+        res = self.client.get(self.TAGS_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
@@ -67,25 +77,27 @@ class PrivateTagsAPITests(TestCase):
     def test_creat_tag_successful(self):
         """Test creating a new tag."""
         payload = {'name': 'Marmitinha'}
-        self.client.post(TAGS_URL, payload)
+        res = self.client.post(self.TAGS_URL, payload)
 
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data['name'], payload['name'])
         exists = Tag.objects.filter(
-            user=self.user,
-            name=payload['name']
+            id=res.data['id'],
+            user=self.user
         ).exists()
         self.assertTrue(exists)
 
     def test_create_tag_invalid(self):
         """Test creating a new tag with invalid payload."""
         payload = {'name': ''}
-        res = self.client.post(TAGS_URL, payload)
+        res = self.client.post(self.TAGS_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_retrieve_tags_assigned_to_recipes(self):
         """Test filtering tags by those assigned to recipes."""
         tag1 = Tag.objects.create(user=self.user, name='Bolo')
-        tag2 = Tag.objects.create(user=self.user, name='Apimentada')
+        Tag.objects.create(user=self.user, name='Apimentada')
         recipe = Recipe.objects.create(
             title='Bolo de Chocolate',
             time_minutes=120,
@@ -94,12 +106,9 @@ class PrivateTagsAPITests(TestCase):
         )
         recipe.tags.add(tag1)
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        res = self.client.get(self.TAGS_URL, {'assigned_only': 1})
 
-        serializer1 = TagSerializer(tag1)
-        serializer2 = TagSerializer(tag2)
-        self.assertIn(serializer1.data, res.data)
-        self.assertNotIn(serializer2.data, res.data)
+        self.assertEqual({tag['id'] for tag in res.data}, {tag1.id})
 
     def test_retrieve_tags_assigned_unique(self):
         """Test filtering tags by assigned returns unique tags."""
@@ -120,6 +129,39 @@ class PrivateTagsAPITests(TestCase):
         recipe1.tags.add(tag)
         recipe2.tags.add(tag)
 
-        res = self.client.get(TAGS_URL, {'assigned_only': 1})
+        res = self.client.get(self.TAGS_URL, {'assigned_only': 1})
+
+        self.assertEqual(len(res.data), 1)
+
+    def test_retrieve_tags_assigned_only_zero(self):
+        """Test that assigned_only=0 returns unassigned tags too."""
+        Tag.objects.create(user=self.user, name='Doce')
+
+        res = self.client.get(self.TAGS_URL, {'assigned_only': 0})
 
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data), 1)
+
+    def test_retrieve_tags_assigned_only_any_integer(self):
+        """Test that any non zero assigned_only filters assigned tags."""
+        tag = Tag.objects.create(user=self.user, name='Doce')
+        Tag.objects.create(user=self.user, name='Japonesa')
+        recipe = Recipe.objects.create(
+            title='Brigadeiro',
+            time_minutes=15,
+            price=4.99,
+            user=self.user
+        )
+        recipe.tags.add(tag)
+
+        res = self.client.get(self.TAGS_URL, {'assigned_only': 2})
+
+        self.assertEqual({t['id'] for t in res.data}, {tag.id})
+
+    def test_retrieve_tags_assigned_only_invalid(self):
+        """Test that a non integer assigned_only is rejected."""
+        for value in ('true', 'abc'):
+            with self.subTest(value=value):
+                res = self.client.get(self.TAGS_URL, {'assigned_only': value})
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -12,5 +12,6 @@ router.register('recipes', views.RecipeViewSet)
 app_name = 'recipe'
 
 urlpatterns = [
+    path('meta/', views.RecipeMetaView.as_view(), name='meta'),
     path('', include(router.urls)),
 ]
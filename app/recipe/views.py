@@ -1,12 +1,36 @@
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework import viewsets, mixins, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.authentication import TokenAuthentication
 
+from django_filters.rest_framework import DjangoFilterBackend
+
 from core.models import Tag, Ingredient, Recipe
 
-from recipe import serializers
+from recipe import filters, serializers
+
+
+def filter_recipe_attrs(queryset, request):
+    """Return the recipe attributes of the authenticated user."""
+    return queryset.filter(
+        user=request.user
+    ).order_by('-name').distinct()
+
+
+def apply_filterset(filterset_class, queryset, request):
+    """Filter a queryset with the request query params."""
+    filterset = filterset_class(
+        request.query_params,
+        queryset=queryset,
+        request=request
+    )
+    if not filterset.is_valid():
+        raise ValidationError(filterset.errors)
+
+    return filterset.qs
 
 
 class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
@@ -15,19 +39,11 @@ class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
     """Base viewset for user owned recipe attributes."""
     authentication_classes = (TokenAuthentication,)
     permission_classes = (IsAuthenticated,)
+    filter_backends = (DjangoFilterBackend,)
 
     def get_queryset(self):
         """Return objects from the current authenticated only."""
-        queryset = self.queryset
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
-        )
-        if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
-
-        return queryset.filter(
-            user=self.request.user
-        ).order_by('-name').distinct()
+        return filter_recipe_attrs(self.queryset, self.request)
 
     def perform_create(self, serializer):
         """Create a new object."""
@@ -38,12 +54,41 @@ class TagViewSet(BaseRecipeAttrViewSet):
     """Manage tags in the database."""
     queryset = Tag.objects.all()
     serializer_class = serializers.TagSerializer
+    filterset_class = filters.TagFilter
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
     """Manage the ingredients in the database."""
     queryset = Ingredient.objects.all()
     serializer_class = serializers.IngredientSerializer
+    filterset_class = filters.IngredientFilter
+
+
+class RecipeMetaView(APIView):
+    """Retrieve the tags and ingredients of the user in one request."""
+    authentication_classes = (TokenAuthentication,)
+    permission_classes = (IsAuthenticated,)
+
+    def get(self, request):
+        """Return the tags and ingredients of the authenticated user."""
+        tags = apply_filterset(
+            filters.TagFilter,
+            filter_recipe_attrs(Tag.objects.all(), request),
+            request
+        )
+        ingredients = apply_filterset(
+            filters.IngredientFilter,
+            filter_recipe_attrs(Ingredient.objects.all(), request),
+            request
+        )
+
+        return Response({
+            'tags': serializers.TagSerializer(tags, many=True).data,
+            'ingredients': serializers.IngredientSerializer(
+                ingredients,
+                many=True
+            ).data,
+        })
 
 
 class RecipeViewSet(viewsets.ModelViewSet):
@@ -69,7 +114,9 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
-        return queryset.filter(user=self.request.user)
+        return queryset.filter(
+            user=self.request.user
+        ).prefetch_related('tags', 'ingredients')
 
     def get_serializer_class(self):
         """Return appropriate serializer class."""
@@ -1,26 +1,33 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.urls import reverse
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from core.tests.utils import fast_password_hasher
 
-CREATE_USER_URL = reverse('user:create')
-TOKEN_URL = reverse('user:token')
-ME_URL = reverse('user:me')
+
+User = get_user_model()
 
 
 def create_user(**params):
-    """Create a new user."""
-    return get_user_model().objects.create_user(**params)
+    """Create a new user, hashing the password with the active hasher."""
+    params['password'] = make_password(params['password'])
+    return User.objects.create(**params)
 
 
+@fast_password_hasher
 class PublicAPITests(TestCase):
     """Test the user API (public)."""
+    client_class = APIClient
 
-    def setUp(self):
-        self.client = APIClient()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.CREATE_USER_URL = reverse('user:create')
+        cls.TOKEN_URL = reverse('user:token')
 
     def test_create_valid_user_success(self):
         """Test creating user with valid payload is successful."""
@@ -29,10 +36,10 @@ class PublicAPITests(TestCase):
             'password': 'ironmangreaterthancaptain',
             'name': 'Tony Stark'
         }
-        res = self.client.post(CREATE_USER_URL, payload)
+        res = self.client.post(self.CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        user = get_user_model().objects.get(**res.data)
+        user = User.objects.get(**res.data)
         self.assertTrue(user.check_password(payload['password']))
         self.assertNotIn('password', res.data)
 
@@ -45,7 +52,7 @@ class PublicAPITests(TestCase):
         }
         create_user(**payload)
 
-        res = self.client.post(CREATE_USER_URL, payload)
+        res = self.client.post(self.CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -56,10 +63,10 @@ class PublicAPITests(TestCase):
             'password': 'than',
             'name': 'Thanos'
         }
-        res = self.client.post(CREATE_USER_URL, payload)
+        res = self.client.post(self.CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.filter(
+        user_exists = User.objects.filter(
             email=payload['email']
         ).exists()
         self.assertFalse(user_exists)
@@ -71,7 +78,7 @@ class PublicAPITests(TestCase):
             'password': 'oclumencia'
         }
         create_user(**payload)
-        res = self.client.post(TOKEN_URL, payload)
+        res = self.client.post(self.TOKEN_URL, payload)
 
         self.assertIn('token', res.data)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -86,7 +93,7 @@ class PublicAPITests(TestCase):
             'email': 'rony@hogwarts.com',
             'password': 'Weasley321'
         }
-        res = self.client.post(TOKEN_URL, payload)
+        res = self.client.post(self.TOKEN_URL, payload)
 
         self.assertNotIn('token', res.data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -97,31 +104,49 @@ class PublicAPITests(TestCase):
             'email': 'hermione@hogwarts.com',
             'password': 'imanerd'
         }
-        res = self.client.post(TOKEN_URL, payload)
+        res = self.client.post(self.TOKEN_URL, payload)
 
         self.assertNotIn('token', res.data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
+
+class PublicAPIValidationTests(SimpleTestCase):
+    """Test the user API (public) requests that never reach the database."""
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.TOKEN_URL = reverse('user:token')
+        cls.ME_URL = reverse('user:me')
+
     def test_create_token_missing_field(self):
         """Test that email and password is required."""
         payload = {
             'email': 'neville',
             'password': ''
         }
-        res = self.client.post(TOKEN_URL, payload)
+        res = self.client.post(self.TOKEN_URL, payload)
 
         self.assertNotIn('token', res.data)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_retrieve_user_unauthorized(self):
         """Test that authentication is required for users."""
-        res = self.client.get(ME_URL)
+        res = self.client.get(self.ME_URL)
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@fast_password_hasher
 class PrivateUserAPITests(TestCase):
     """Test API requests that require authentication."""
+    client_class = APIClient
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ME_URL = reverse('user:me')
 
     def setUp(self):
         self.user = create_user(
@@ -129,12 +154,11 @@ class PrivateUserAPITests(TestCase):
             password='phoenix',
             name='Albus Dumbledore'
         )
-        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):
         """Test retrieving profile for logged in used."""
-        res = self.client.get(ME_URL)
+        res = self.client.get(self.ME_URL)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, {
@@ -144,7 +168,7 @@ class PrivateUserAPITests(TestCase):
 
     def test_post_me_not_allowed(self):
         """Test that POST is not allowed on the ME url."""
-        res = self.client.post(ME_URL, {})
+        res = self.client.post(self.ME_URL, {})
 
         self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
@@ -155,7 +179,7 @@ class PrivateUserAPITests(TestCase):
             'password': 'newpassword'
         }
 
-        res = self.client.patch(ME_URL, payload)
+        res = self.client.patch(self.ME_URL, payload)
 
         self.user.refresh_from_db()
         self.assertEqual(self.user.name, payload['name'])